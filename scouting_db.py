@@ -8,10 +8,9 @@ from scouting_mdb import SampleOperations
 
 
 def CheckSQLite3(path: str) -> bool:
-    """Check if the file is a SQLite3 database."""
+    """Check if the file is a SQLite3 database (magic string at the start of the file)."""
     with open(path, 'rb') as f:
-        header = f.read(100)
-    return b'SQLite format 3' in header
+        return f.read(16) == b'SQLite format 3\x00'
 
 
 if __name__ == "__main__":
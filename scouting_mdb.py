@@ -10,15 +10,21 @@ The script:
 """
 
 import shutil
-import pandas as pd
+import typing as t
 import sqlalchemy as sa
 from pathlib import Path
 from sqlalchemy.engine import URL
 
+if t.TYPE_CHECKING:
+    import pandas as pd
 
-def ExecuteQuery(engine: sa.Engine, query: str) -> pd.DataFrame:
+
+def ExecuteQuery(engine: sa.Engine, query: str) -> "pd.DataFrame":
     """Execute a query and return the result as a pandas dataframe"""
 
+    # pandas is imported here, so scripts only running updates do not pay its import cost
+    import pandas as pd
+
     with engine.begin() as conn:
         try:
             return pd.read_sql_query(sa.text(query), conn)
@@ -1,5 +1,8 @@
 """MCP server for Microsoft Access databases and CSV files."""
 
+import typing as t
+import threading
+import pydantic_core
 from fastmcp import FastMCP
 
 from src.database     import *
@@ -8,6 +11,13 @@ from src.excel        import *
 from src.notes        import *
 
 
+def SerializeResult(data: t.Any) -> str:
+    """Serialize tool results to compact JSON, using the same encoder as FastMCP (pydantic-core).
+    The FastMCP default indents the output, which makes large query results much bigger.
+    """
+    return pydantic_core.to_json(data, fallback=str).decode()
+
+
 # Initialize the MCP server for protocol-level communication
 mcp = FastMCP(
     name="MCP Server for MS Access, SQLite 3, Excel, CSV files",
@@ -35,11 +45,15 @@ mcp = FastMCP(
     To export data into Excel files, use haris-musa/excel-mcp-server instead.
 
     NOTE: for important databases, ensure there is a backup (or create it) before modifying data.
-    """
+    """,
+    tool_serializer=SerializeResult,
 )
 
 # Set up a dictionary to hold DBConnection objects for different database connections
+# Tools read it directly from the server, so it must exist before any tool is called
+# The lock keeps connect/disconnect consistent when tools are called concurrently
 setattr(mcp, "connections", {})
+setattr(mcp, "connections_lock", threading.Lock())
 
 
 # Register tools
@@ -47,6 +61,7 @@ mcp.tool(name="list")(ListConnections)
 mcp.tool(name="create")(CreateDatabase)
 mcp.tool(name="connect")(Connect)
 mcp.tool(name="disconnect")(Disconnect)
+mcp.tool(name="describe")(DescribeTable)
 mcp.tool(name="query")(Query)
 mcp.tool(name="update")(Update)
 mcp.tool(name="import_csv")(ImportCSV)
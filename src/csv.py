@@ -4,7 +4,6 @@ from typing import Literal, Any
 from dataclasses import dataclass
 
 import csv
-import pandas as pd
 
 from fastmcp import Context
 from fastmcp.exceptions import FastMCPError
@@ -38,6 +37,9 @@ def ImportCSV(
         delimiter: separator of the CSV file, leave empty to autodetect (default: ",")
     """
 
+    # pandas is imported when needed, to keep it out of the server startup
+    import pandas as pd
+
     # Get the engine for the database connection
     engine = GetEngine(ctx, key)
 
@@ -78,6 +80,8 @@ def ExportCSV(key: str, dbTableName: str, csvPath: str, ctx: Context,
     When overwriting a file, use the same encoding and delimiter as the original file, if possible.
     """
 
+    import pandas as pd
+
     # Get the data from the database
     engine = GetEngine(ctx, key)
     df = pd.read_sql_table(dbTableName, engine)
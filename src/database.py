@@ -1,13 +1,25 @@
-"""Tools for managing database connections and data operations."""
-
+"""Tools for managing database connections and data operations.
+Only SQLAlchemy, FastMCP and the standard library are imported at startup:
+access-parser and sqlite3 are imported when needed (Access 97 files, new SQLite files).
+"""
+
+import os
+import re
+import sys
+import mmap
+import atexit
 import shutil
+import threading
+import itertools
+import functools
 import typing as t
+from collections import OrderedDict
 from pathlib import Path
-from dataclasses import dataclass
+from dataclasses import dataclass, field
 
-import pandas as pd
 import sqlalchemy as sa
 from sqlalchemy.engine import URL
+from sqlalchemy.pool import StaticPool
 
 from fastmcp import Context
 from fastmcp.exceptions import FastMCPError
@@ -19,37 +31,157 @@ from src.notes import ReadNotes
 # =================================
 
 
+# Query implementation bound to a connection: (sql, params, columnar) -> records or columnar result
+QueryFunction = t.Callable[[str, dict[str, t.Any], bool], list[dict] | dict[str, list]]
+
+
 @dataclass
 class DBConnection:
     """Dataclass to hold information about a database connection."""
 
     key: str            # Unique identifier for the connection
-    engine: sa.Engine   # SQLAlchemy engine for the connection (None for Access 97)
+    engine: sa.Engine | None  # SQLAlchemy engine for the connection (None for Access 97)
     path: str           # Path to the database file
     is_access97: bool = False  # True if using access-parser for Access 97 databases
-    access97_db = None  # AccessParser instance for Access 97 databases
+    access97_db: t.Any = None  # AccessParser instance for Access 97 databases
+    parsed_tables: OrderedDict[str, t.Any] = field(default_factory=OrderedDict)  # Access 97 tables parsed recently
+    schema_cache: dict[str, list[str]] = field(default_factory=dict)  # Column names by table name (Access 97)
+    pending: bool = False  # True for the placeholder reserving the key while the database is opened
+    query_fn: QueryFunction = field(init=False, repr=False)  # Query implementation for the database type
+
+    def __post_init__(self) -> None:
+        # Bind the query implementation once, instead of checking the database type on every query
+        # Placeholders are never returned by GetConnection, they need no query implementation
+        if self.pending:
+            return
+        if self.is_access97:
+            self.query_fn = _MakeAccess97Query(self.access97_db, self.parsed_tables)
+        else:
+            self.query_fn = _MakeSqlaQuery(self.engine)
+
 
 
+def _GetConnections(ctx: Context) -> dict[str, DBConnection]:
+    """Return the dictionary of active connections, created on the server at startup."""
+    return ctx.fastmcp.__dict__["connections"]
+
+
+def _GetConnectionsLock(ctx: Context) -> threading.Lock:
+    """Return the lock guarding changes to the dictionary of active connections."""
+    return ctx.fastmcp.__dict__["connections_lock"]
+
 
 def GetConnection(ctx: Context, key: str) -> DBConnection:
     """Retrieve the DBConnection object for the given key, if it exists."""
 
-    connections = getattr(ctx.fastmcp, "connections", {})
-    if key not in connections:
+    connection = _GetConnections(ctx).get(key)
+    if connection is None:
         raise FastMCPError(f"Not connected to the database with key '{key}'. Please use connect first.")
-    return connections[key]
+    if connection.pending:
+        raise FastMCPError(f"The connection with key '{key}' is still being opened, please retry.")
+    return connection
 
 
 def GetEngine(ctx: Context, key: str) -> sa.Engine:
     """Retrieve the SQLAlchemy engine for the given key, if it exists."""
-    return GetConnection(ctx, key).engine
+
+    engine = GetConnection(ctx, key).engine
+    if engine is None:
+        raise FastMCPError(f"The database with key '{key}' is an Access 97 database (read-only), "
+            "only the query and describe tools are supported.")
+    return engine
 
 
 def ListConnections(ctx: Context) -> list[dict[str, t.Any]]:
     """List all active database connections, returning key and path for each."""
 
-    connections = getattr(ctx.fastmcp, "connections", {})
-    return [{"key": conn.key, "path": conn.path} for conn in connections.values()]
+    connections = _GetConnections(ctx)
+    return [{"key": conn.key, "path": conn.path} for conn in connections.values() if not conn.pending]
+
+
+
+# DATABASE TYPE DETECTION
+# =======================
+
+
+DBKind = t.Literal["sqlite", "access_modern", "access97"]
+
+# Database type by file extension (lower case), used when the file header cannot be read (new or empty files)
+_KIND_BY_SUFFIX: dict[str, DBKind] = {
+    ".db":      "sqlite",
+    ".sqlite":  "sqlite",
+    ".sqlite3": "sqlite",
+    ".mdb":     "access_modern",
+    ".accdb":   "access_modern",
+}
+
+# ODBC drivers for MS Access, by order of preference
+_ACCESS_DRIVERS = ("Microsoft Access Driver (*.mdb, *.accdb)", "Microsoft Access Driver (*.mdb)")
+
+# Drivers able to open .accdb files (the legacy driver opens only .mdb files)
+_ACCDB_DRIVERS = _ACCESS_DRIVERS[:1]
+
+
+@functools.cache
+def _InstalledDrivers() -> frozenset[str]:
+    """Return the names of the installed ODBC drivers (none if pyodbc is missing).
+    Drivers are listed once: failing connections to a missing driver are slow.
+    """
+
+    try:
+        import pyodbc
+    except ImportError:
+        return frozenset()
+    return frozenset(pyodbc.drivers())
+
+
+def _AccessDriver(path: str) -> str | None:
+    """Return the name of the installed ODBC driver able to open the MS Access file, None if missing."""
+
+    candidates = _ACCDB_DRIVERS if Path(path).suffix.lower() == ".accdb" else _ACCESS_DRIVERS
+    return next((driver for driver in candidates if driver in _InstalledDrivers()), None)
+
+
+# Connection URL builders for the database types handled by SQLAlchemy
+_CONNECTION_URLS: dict[DBKind, t.Callable[[str], str | URL]] = {
+    "sqlite": lambda path: f"sqlite:///{path}",
+    "access_modern": lambda path: URL.create("access+pyodbc", query={
+        "odbc_connect": f"DRIVER={{{_AccessDriver(path)}}};DBQ={path};"}),
+}
+
+
+# Bytes read to detect the database type (up to the Jet version byte of MS Access files)
+_HEADER_SIZE = 0x15
+
+
+def _DetectKind(path: str) -> DBKind | None:
+    """Detect the database type from the magic bytes at the start of the file.
+    Falls back to the file extension for new or empty files (missing or shorter than the header),
+    returns None if unknown: existing files with a foreign header are rejected, whatever their name.
+    """
+
+    try:
+        with open(path, "rb") as f:
+            header = f.read(_HEADER_SIZE)
+    except OSError:
+        header = b""
+
+    # SQLite 3: magic string at offset 0
+    if header.startswith(b"SQLite format 3\x00"):
+        return "sqlite"
+
+    # MS Access: magic string at offset 4, Jet version at offset 0x14 (0 = Jet 3, Access 97)
+    if header[4:19] in (b"Standard Jet DB", b"Standard ACE DB"):
+        return "access97" if header[0x14:0x15] == b"\x00" else "access_modern"
+
+    if len(header) < _HEADER_SIZE:
+        return _KindFromSuffix(path)
+    return None
+
+
+def _KindFromSuffix(path: str | Path) -> DBKind | None:
+    """Return the database type for the file extension (case-insensitive, e.g. .MDB), None if unknown."""
+    return _KIND_BY_SUFFIX.get(Path(path).suffix.lower())
 
 
 
@@ -57,6 +189,164 @@ def ListConnections(ctx: Context) -> list[dict[str, t.Any]]:
 # =====================
 
 
+# Connection pool options for file databases, by database type
+# MS Access: keep warm ODBC connections for concurrent tool calls (each handshake is expensive),
+# check them before use and recycle them to survive ODBC idle timeouts
+# SQLite: smaller pool (writes are serialized anyway), local connections never go stale
+_POOL_OPTIONS: dict[DBKind, dict[str, t.Any]] = {
+    "access_modern": {
+        "pool_size": 10,
+        "max_overflow": 20,
+        "pool_pre_ping": True,
+        "pool_recycle": 1800,
+    },
+    "sqlite": {
+        "pool_size": 5,
+        "max_overflow": 10,
+    },
+}
+
+# PRAGMA statements executed on each new SQLite connection
+_SQLITE_PRAGMAS = (
+    "PRAGMA synchronous=NORMAL",
+    "PRAGMA temp_store=MEMORY",
+    "PRAGMA cache_size=-65536",     # 64 MiB page cache
+)
+
+# PRAGMA statements executed only for SQLite files (no effect on in-memory databases)
+_SQLITE_FILE_PRAGMAS = (
+    "PRAGMA journal_mode=WAL",
+    "PRAGMA mmap_size=268435456",   # 256 MiB memory-mapped I/O
+)
+
+# SQLAlchemy engines by connection URL, reused when connecting again to the same database
+# In-memory databases are not cached, since their data must be dropped on disconnect
+_engineCache: dict[str, sa.Engine] = {}
+
+
+@atexit.register
+def _DisposeEngines() -> None:
+    """Dispose all cached engines when the process exits."""
+    for engine in _engineCache.values():
+        engine.dispose()
+
+
+def _CreateEngine(connectionUrl: str | URL, kind: DBKind, inMemory: bool = False) -> sa.Engine:
+    """Create the SQLAlchemy engine for the given database type, with tuned connection pool.
+    In-memory databases share a single connection, otherwise each checkout would see an empty database.
+    SQLite connections are tuned with PRAGMA statements when opened.
+    MS Access connections send parameter lists to the ODBC driver in bulk (fast_executemany).
+    """
+
+    if inMemory:
+        engine = sa.create_engine(connectionUrl, poolclass=StaticPool,
+            connect_args={"check_same_thread": False})
+    else:
+        engine = sa.create_engine(connectionUrl, **_POOL_OPTIONS[kind])
+
+    if kind == "sqlite":
+        pragmas = _SQLITE_PRAGMAS if inMemory else _SQLITE_FILE_PRAGMAS + _SQLITE_PRAGMAS
+
+        @sa.event.listens_for(engine, "connect")
+        def _SetPragmas(dbapiConnection, connectionRecord) -> None:
+            cursor = dbapiConnection.cursor()
+            for pragma in pragmas:
+                cursor.execute(pragma)
+            cursor.close()
+
+    elif kind == "access_modern":
+
+        @sa.event.listens_for(engine, "before_cursor_execute")
+        def _SetFastExecutemany(conn, cursor, statement, parameters, context, executemany) -> None:
+            if executemany:
+                cursor.fast_executemany = True
+
+    return engine
+
+
+def _OpenAccess97(databasePath: str) -> t.Any:
+    """Open an Access 97 database with access-parser, reading it through a read-only memory map.
+    access-parser copies each page out of the file while indexing it, so the mapping is closed
+    right after, and the parser does not keep a second copy of the whole file in memory.
+    The memory map replays the steps of AccessParser.__init__ (private methods of access-parser):
+    if they change in a later release, the database is opened by AccessParser from its path.
+    """
+
+    from access_parser import AccessParser
+
+    class MappedAccessParser(AccessParser):
+        """AccessParser reading the database from a memory map, instead of the file path."""
+
+        def __init__(self, dbData: mmap.mmap) -> None:
+            self.db_data = dbData
+            # the header fits in the first page (2 KB for Access 97): pass only that,
+            # the header parser copies its input to a buffer
+            self._parse_file_header(dbData[:0x800])
+            self._table_defs, self._data_pages, self._all_pages = categorize_pages(dbData, self.page_size)
+            self._tables_with_data = self._link_tables_to_data()
+            self.catalog = self._parse_catalog()
+            self.extra_props = self.parse_msys_table()
+            self.db_data = None
+
+    try:
+        from access_parser.utils import categorize_pages
+        with open(databasePath, "rb") as f, mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as dbData:
+            return MappedAccessParser(dbData)
+    except (AttributeError, TypeError, ImportError):
+        return AccessParser(databasePath)
+
+
+# Initial size of new SQLite database files
+_SQLITE_PREALLOCATE = 16 * 1024 * 1024
+
+# Linux ioctl to clone a file as a reflink (shared data blocks, on btrfs and XFS)
+_FICLONE = 0x40049409
+
+# Empty MS Access database, copied to create new databases (checked once, it ships with the server)
+_EMPTY_MDB_TEMPLATE = Path(__file__).parent.parent / "empty.mdb"
+_EMPTY_MDB_FOUND = _EMPTY_MDB_TEMPLATE.exists()
+
+# Templates smaller than this are kept in memory, when they cannot be copied by the kernel
+_TEMPLATE_CACHE_SIZE = 1024 * 1024
+
+
+@functools.cache
+def _ReadTemplate(source: Path) -> bytes:
+    """Read a small template file once, later copies are written from memory."""
+    return source.read_bytes()
+
+
+def _CopyTemplate(source: Path, target: Path) -> None:
+    """Copy a template file, using the fastest method supported by the system:
+    - reflink (FICLONE, btrfs/XFS): the copy shares data blocks with the template, no data is copied
+    - copy_file_range (Linux): the kernel copies data without user-space buffers
+    - otherwise, write the template from memory if small, or use shutil.copyfile
+    """
+
+    with open(source, "rb") as src, open(target, "wb") as dst:
+        try:
+            import fcntl
+            fcntl.ioctl(dst.fileno(), _FICLONE, src.fileno())
+            return
+        except (ImportError, OSError):
+            pass
+
+        try:
+            remaining = os.fstat(src.fileno()).st_size
+            while remaining > 0:
+                copied = os.copy_file_range(src.fileno(), dst.fileno(), remaining)
+                if copied == 0:
+                    break
+                remaining -= copied
+            return
+        except (AttributeError, OSError):
+            pass
+
+    if source.stat().st_size < _TEMPLATE_CACHE_SIZE:
+        target.write_bytes(_ReadTemplate(source))
+    else:
+        shutil.copyfile(source, target)
+
 
 def CreateDatabase(targetPath: str, ctx: Context) -> str:
     """Create a new empty database, detect type based on extension.
@@ -69,26 +359,46 @@ def CreateDatabase(targetPath: str, ctx: Context) -> str:
         raise FastMCPError(f"Target file already exists: {target}")
 
     try:
+        kind = _KindFromSuffix(target)
+
         # For SQLite databases, create an empty database file
-        if targetPath.endswith(".db") or targetPath.endswith(".sqlite") or targetPath.endswith(".sqlite3"):
+        if kind == "sqlite":
+            # No journal and no fsync: there is nothing to protect in an empty database
             import sqlite3
-            sqlite3.connect(targetPath)
+            conn = sqlite3.connect(targetPath, isolation_level=None)
+            try:
+                try:
+                    conn.execute("PRAGMA page_size=4096")
+                    conn.execute("PRAGMA journal_mode=OFF")
+                    conn.execute("PRAGMA synchronous=OFF")
+
+                    # Pre-allocate the file: pages of the dropped table stay in the free list, and are reused
+                    # by the first inserts without growing the file (no VACUUM, it would shrink it back)
+                    conn.execute("CREATE TABLE _preallocate (data BLOB)")
+                    conn.execute("INSERT INTO _preallocate VALUES (zeroblob(?))", (_SQLITE_PREALLOCATE,))
+                    conn.execute("DROP TABLE _preallocate")
+                finally:
+                    conn.close()
+
+            # Remove the partial file (e.g. disk full), so that the database can be created again
+            except Exception:
+                target.unlink(missing_ok=True)
+                raise
             return f"SQLite database created at {target}"
         
         # For MS Access databases, copy the template
-        elif targetPath.endswith(".mdb") or targetPath.endswith(".accdb"):
+        elif kind == "access_modern":
 
             # Ensure the empty template exists
-            emptyTemplate = Path(__file__).parent.parent / "empty.mdb"
-            if not emptyTemplate.exists():
-                raise FastMCPError(f"MS Access empty template database not found: {emptyTemplate}")
+            if not _EMPTY_MDB_FOUND:
+                raise FastMCPError(f"MS Access empty template database not found: {_EMPTY_MDB_TEMPLATE}")
             
-            shutil.copy(str(emptyTemplate), str(target))
+            _CopyTemplate(_EMPTY_MDB_TEMPLATE, target)
             return f"MS Access database created at {target}"
         
         else:
             raise FastMCPError(f"Unsupported database file extension: {targetPath}. "
-                "Supported extensions: .db, .sqlite, .sqlite3, .mdb, .accdb")
+                f"Supported extensions: {', '.join(_KIND_BY_SUFFIX)}")
             
     except Exception as e:
         raise FastMCPError(f"Failed to create database: {e}")
@@ -103,81 +413,85 @@ def Connect(key: str, ctx: Context, databasePath: str = "", readNotes: bool = Fa
     NOTE: Access 97 databases (.mdb) are supported in read-only mode using access-parser library.
     """
 
-    # Check if the key already exists in the engines dictionary
-    connections = getattr(ctx.fastmcp, "connections")
-    existing = connections.get(key)
-    if existing:
-        raise FastMCPError(f"Database connection with key '{key}' already exists."
-            f"Existing connection: {existing.path}")
-
     # If no database path is specified, create an in-memory database
     # This allows us to load CSV data without writing to disk
     if databasePath == "":
+        kind = "sqlite"
         connectionUrl = "sqlite:///:memory:"
 
-    # For Microsoft Access files, use the ODBC driver
-    elif databasePath.endswith(".mdb") or databasePath.endswith(".accdb"):
-        connectionString = f"DRIVER={{Microsoft Access Driver (*.mdb, *.accdb)}};DBQ={databasePath};"
-        connectionUrl = URL.create("access+pyodbc", query={"odbc_connect": connectionString})
-
-    # For SQLite files, use sqlite:/// connection string
-    elif databasePath.endswith(".db") or databasePath.endswith(".sqlite") or databasePath.endswith(".sqlite3"):
-        connectionUrl = f"sqlite:///{databasePath}"
-
-    # Handle other unknown file types
-    else: raise FastMCPError(f"Unsupported database file extension: {databasePath}")
+    # Otherwise detect the database type from the file header
+    else:
+        kind = _DetectKind(databasePath)
+        if kind is None:
+            raise FastMCPError(f"Not a supported database file (unknown header or extension): {databasePath}")
+        if kind == "access_modern" and _AccessDriver(databasePath) is None:
+            raise FastMCPError("No MS Access ODBC driver able to open this file (or pyodbc not installed): "
+                "please install the Microsoft Access Database Engine (required for .accdb files).")
+        connectionUrl = None if kind == "access97" else _CONNECTION_URLS[kind](databasePath)
+
+    # Check if the key already exists, and reserve it with a placeholder while the database is opened:
+    # concurrent calls with the same key fail here, instead of both creating an engine
+    connections = _GetConnections(ctx)
+    with _GetConnectionsLock(ctx):
+        existing = connections.get(key)
+        if existing:
+            raise FastMCPError(f"Database connection with key '{key}' already exists."
+                f"Existing connection: {existing.path}")
+        placeholder = connections[key] = DBConnection(key=key, engine=None, path=databasePath, pending=True)
 
     try:
         engine = None
         is_access97 = False
         access97_db = None
 
-        # For Access databases, try ACE driver first, then fall back to access-parser
-        if databasePath and (databasePath.endswith(".mdb") or databasePath.endswith(".accdb")):
+        # Access 97 files cannot be opened by the ACE driver, use access-parser (read-only)
+        if kind == "access97":
             try:
-                # Try to connect using ACE driver
-                engine = sa.create_engine(connectionUrl)
-                # test the connection
+                access97_db = _OpenAccess97(databasePath)
+                is_access97 = True
+                message = f"Successfully connected to Access 97 database with key '{key}' using access-parser (read-only)."
+            except ImportError:
+                raise FastMCPError(
+                    f"Access 97 database detected but access-parser library is not installed. "
+                    f"Please install it with: pip install access-parser"
+                )
+            except Exception as ap_error:
+                raise FastMCPError(f"Failed to connect to Access 97 database using access-parser: {str(ap_error)}")
+
+        # Other databases are handled by SQLAlchemy
+        else:
+            engine = _engineCache.get(str(connectionUrl))
+            if engine is None:
+                engine = _CreateEngine(connectionUrl, kind, inMemory=databasePath == "")
+                # test the connection, to surface errors early (missing driver, locked file, invalid path)
+                # Opening a SQLite file is enough (it runs the PRAGMAs, the connection stays in the pool),
+                # ODBC drivers may connect lazily, so they also run a probe statement
                 with engine.connect() as conn:
-                    conn.execute(sa.text("SELECT 1"))
+                    if kind != "sqlite":
+                        conn.exec_driver_sql("SELECT 1")
+                # another connection may have cached an engine for the same file meanwhile, keep only one
+                if databasePath:
+                    cached = _engineCache.setdefault(str(connectionUrl), engine)
+                    if cached is not engine:
+                        engine.dispose()
+                        engine = cached
+            if kind == "access_modern":
                 message = f"Successfully connected to Access database with key '{key}' using ACE driver."
-            except Exception as ace_error:
-                # Check if it's an Access 97 format error
-                error_str = str(ace_error).lower()
-                if "cannot open a database created with a previous version" in error_str:
-                    # It's Access 97, fall back to access-parser
-                    try:
-                        from access_parser import AccessParser
-                        access97_db = AccessParser(databasePath)
-                        is_access97 = True
-                        engine = None
-                        message = f"Successfully connected to Access 97 database with key '{key}' using access-parser (read-only)."
-                    except ImportError:
-                        raise FastMCPError(
-                            f"Access 97 database detected but access-parser library is not installed. "
-                            f"Please install it with: pip install access-parser"
-                        )
-                    except Exception as ap_error:
-                        raise FastMCPError(f"Failed to connect to Access 97 database using access-parser: {str(ap_error)}")
-                else:
-                    # Not an Access 97 error, propagate the original error
-                    raise ace_error
-        else:
-            # Non-Access database, create engine normally
-            engine = sa.create_engine(connectionUrl)
-            # test the connection
-            with engine.connect() as conn:
-                conn.execute(sa.text("SELECT 1"))
-            message = f"Successfully connected to the database with key '{key}'."
-
-        # store the connection
-        connections[key] = DBConnection(
+            else:
+                message = f"Successfully connected to the database with key '{key}'."
+
+        # store the connection in place of the placeholder (Disconnect refuses to remove placeholders)
+        connection = DBConnection(
             key=key,
             engine=engine,
             path=databasePath,
             is_access97=is_access97,
             access97_db=access97_db
         )
+        with _GetConnectionsLock(ctx):
+            if connections.get(key) is not placeholder:
+                raise FastMCPError(f"The connection with key '{key}' was removed while opening the database.")
+            connections[key] = connection
 
         # read notes associated with the database
         if readNotes:
@@ -190,20 +504,33 @@ def Connect(key: str, ctx: Context, databasePath: str = "", readNotes: bool = Fa
         return message
 
     except Exception as e:
+        # remove the placeholder, unless already replaced by the connection (error while reading notes)
+        with _GetConnectionsLock(ctx):
+            if connections.get(key) is placeholder:
+                del connections[key]
         raise FastMCPError(f"Error connecting to database: {str(e)}")
 
 
 def Disconnect(key: str, ctx: Context) -> str:
     """Disconnect from the MS Access database identified by key."""
 
-    # Ensure the connection exists
-    connections = getattr(ctx.fastmcp, "connections", {})
-    if key not in connections:
-        raise FastMCPError(f"No active database connection with key '{key}' to disconnect.")
-    
-    # Dispose of the engine
-    connections[key].engine.dispose()
-    del connections[key]
+    # Ensure the connection exists, removing it before releasing its resources
+    # Connections still being opened are left to Connect, which would register them afterwards
+    connections = _GetConnections(ctx)
+    with _GetConnectionsLock(ctx):
+        connection = connections.get(key)
+        if connection is None:
+            raise FastMCPError(f"No active database connection with key '{key}' to disconnect.")
+        if connection.pending:
+            raise FastMCPError(f"The connection with key '{key}' is still being opened, please retry.")
+        del connections[key]
+
+    # Dispose of the engine (Access 97 connections have no engine)
+    # This closes pooled connections right away: the in-memory database is dropped with its only
+    # connection, cached engines of file databases reconnect when used again
+    if connection.engine is not None:
+        connection.engine.dispose()
+    connection.parsed_tables.clear()
     return f"Disconnected from the database with key '{key}'."
 
 
@@ -212,97 +539,186 @@ def Disconnect(key: str, ctx: Context) -> str:
 # ===============
 
 
-def Query(key: str, sql: str, ctx: Context, params: dict[str, t.Any] = {}) -> list[dict]:
-    """Execute a SELECT query on the database identified by key and return results as a list of records.
-    Use backticks to escape table and column names.
-    ALWAYS insert named parameters (:param_name) in the SQL query to avoid SQL injection.
-    Pass a dictionary as params to provide values for the SQL query.
-    Before executing a query, make sure to know the record count, using SELECT TOP (Access)
-    or LIMIT (SQLite) to limit the number of records returned and avoid large responses.
+# Number of rows fetched from the cursor at a time by Query
+_QUERY_BATCH_SIZE = 10_000
 
-    IMPORTANT FOR MS ACCESS ONLY:
-    Do not use this tool to discover existing tables or query system objects or schema.
-    Instead, ask the user about existing tables, their purpose, structure and content.
-    To discover the structure of a table, use SELECT TOP 1 * FROM <table_name>.
+# Table name in the FROM clause of Access 97 queries (SELECT ... FROM table_name [WHERE ...])
+# The name may be escaped with backticks or square brackets (Access syntax), allowing spaces
+_FROM_RE = re.compile(r"FROM\s+(?:`([^`]+)`|\[([^\]]+)\]|([^`\[\s(,;]+))", re.IGNORECASE)
 
-    NOTE: For Access 97 databases (read-only), this function supports basic SELECT queries
-    with simple WHERE conditions. Complex queries may not be fully supported.
+# Maximum number of parsed Access 97 tables kept in memory for each connection
+_PARSED_TABLES_MAX = 8
+
+# Number of parameter sets sent to the driver at a time by Update
+_UPDATE_BATCH_SIZE = 10_000
+
+
+@functools.lru_cache(maxsize=256)
+def _Text(sql: str) -> sa.TextClause:
+    """Return the SQLAlchemy statement for the SQL text, reused when the same text is run again.
+    Text clauses are immutable, parsing bind parameters is done once per distinct statement.
+    """
+    return sa.text(sql)
+
+
+def DescribeTable(key: str, table: str, ctx: Context) -> list[str]:
+    """Return the column names of a table in the database identified by key.
+    Use this tool to discover the structure of a table, instead of querying its first record.
     """
 
     conn_info = GetConnection(ctx, key)
 
-    # For Access 97 databases using access-parser
-    if conn_info.is_access97:
+    # Other databases: reflect the table using SQLAlchemy
+    # Reflection is cheap and always up to date, even if the table was changed through another key
+    if not conn_info.is_access97:
+        try:
+            return [column["name"] for column in sa.inspect(GetEngine(ctx, key)).get_columns(table)]
+        except sa.exc.NoSuchTableError:
+            raise FastMCPError(f"Table '{table}' not found")
+        except Exception as e:
+            raise FastMCPError(f"Error describing table '{table}': {e}")
+
+    # Access 97: read the table definition, without parsing its data pages
+    # Files are read-only, so column names are cached for the connection
+    if table in conn_info.schema_cache:
+        return conn_info.schema_cache[table]
+    try:
+        tableDef = conn_info.access97_db.get_table(table)
+    except Exception as e:
+        raise FastMCPError(f"Error describing table '{table}': {e}")
+    if tableDef is None:
+        raise FastMCPError(f"Table '{table}' not found")
+
+    columns = conn_info.schema_cache[table] = [column.col_name_str for column in tableDef.columns.values()]
+    return columns
+
+
+def _Columnar(columns: list[str], rows: t.Iterable[t.Sequence[t.Any]]) -> dict[str, list]:
+    """Build a columnar query result: column names and, for each column, the list of its values."""
+    return {"columns": columns, "data": [list(values) for values in zip(*rows)] or [[] for _ in columns]}
+
+
+def _ExecuteQuery(conn: sa.Connection, sql: str, params: dict[str, t.Any]) -> tuple[list[str], t.Iterator[sa.Row]]:
+    """Execute a query, returning the column names and an iterator over the rows.
+    Rows are fetched in batches (server-side where supported) while iterating, the connection must stay open.
+    Batches are lists filled by fetchmany, so there is no per-row call into the result object.
+    """
+
+    conn.execution_options(yield_per=_QUERY_BATCH_SIZE)
+    result = conn.execute(_Text(sql), params)
+    # interned names are shared by the results of all queries on the same tables
+    columns = [sys.intern(column) for column in result.keys()]
+    return columns, itertools.chain.from_iterable(result.partitions(_QUERY_BATCH_SIZE))
+
+
+def _IterRecords(engine: sa.Engine, sql: str, params: dict[str, t.Any]) -> t.Iterator[dict[str, t.Any]]:
+    """Yield the records of a query one by one, only one batch of rows is held in memory.
+    The connection is released when the generator is exhausted or closed.
+    """
+
+    with engine.begin() as conn:
+        columns, rows = _ExecuteQuery(conn, sql, params)
+        for row in rows:
+            yield dict(zip(columns, row))
+
+
+def _MakeSqlaQuery(engine: sa.Engine) -> QueryFunction:
+    """Build the query function for databases handled by SQLAlchemy."""
+
+    def QuerySqla(sql: str, params: dict[str, t.Any], columnar: bool) -> list[dict] | dict[str, list]:
+
+        # Build results directly from the cursor
+        # SQLAlchemy already converts values to Python types, no need for a pandas DataFrame
+        # Tools must return the whole result (no streaming responses in MCP yet), records are collected here
+        if columnar:
+            with engine.begin() as conn:
+                return _Columnar(*_ExecuteQuery(conn, sql, params))
+        return list(_IterRecords(engine, sql, params))
+
+    return QuerySqla
+
+
+def _MakeAccess97Query(access97_db: t.Any, parsedTables: OrderedDict[str, t.Any]) -> QueryFunction:
+    """Build the query function for Access 97 databases, read with access-parser.
+    Parsed tables are stored in parsedTables: Access 97 files are read-only, so they are reused by next queries.
+    Only the most recently used tables are kept (_PARSED_TABLES_MAX), to bound memory usage.
+    """
+
+    def QueryAccess97(sql: str, params: dict[str, t.Any], columnar: bool) -> list[dict] | dict[str, list]:
         if params:
             raise FastMCPError(
                 "Access 97 databases (via access-parser) do not support parameterized queries. "
                 "Please provide literal values in your SQL query instead."
             )
 
-        # Parse the SQL query to extract table name
-        # Support basic SELECT * FROM table [WHERE conditions]
-        import re
-        sql_upper = sql.upper().strip()
-
-        # Check if it's a valid SELECT query
-        if not sql_upper.startswith("SELECT"):
+        # Check if it's a valid SELECT query (only the first keyword is upper-cased)
+        if sql.lstrip()[:6].upper() != "SELECT":
             raise FastMCPError(
                 "Access 97 databases (via access-parser) only support SELECT queries. "
                 "Other SQL operations are not supported for Access 97 files."
             )
 
         # Extract table name from SELECT query
-        # Pattern: SELECT ... FROM table_name [WHERE ...]
-        match = re.search(r"FROM\s+`?([^`\s(,;]+)`?", sql, re.IGNORECASE)
+        # Support basic SELECT * FROM table [WHERE conditions]
+        match = _FROM_RE.search(sql)
         if not match:
             raise FastMCPError(
                 "Could not extract table name from query. "
                 "For Access 97 databases, use simple SELECT queries like: SELECT * FROM TableName"
             )
 
-        table_name = match.group(1)
+        table_name = match.group(match.lastindex)
 
         try:
-            # Parse the table using access-parser
-            table = conn_info.access97_db.parse_table(table_name)
-
-            # Convert to list of dicts
-            # access-parser returns list of tuples with column info
-            result = []
-            if hasattr(table, 'columns'):
-                columns = table.columns
-            elif hasattr(table, '__getitem__') and len(table) > 0:
-                # Try to get column names from first row if available
-                columns = list(table[0].keys()) if hasattr(table[0], 'keys') else []
+            # Parse the table using access-parser, unless already parsed
+            table = parsedTables.get(table_name)
+            if table is None:
+                table = parsedTables[table_name] = access97_db.parse_table(table_name)
+                if len(parsedTables) > _PARSED_TABLES_MAX:
+                    parsedTables.popitem(last=False)
             else:
-                # Fallback: use catalog if available
-                columns = list(conn_info.access97_db.catalog.keys()) if conn_info.access97_db.catalog else []
-
-            # Get rows
-            if hasattr(table, '__iter__'):
-                for row in table:
-                    if hasattr(row, '_asdict'):
-                        result.append(row._asdict())
-                    elif hasattr(row, '__dict__'):
-                        result.append(vars(row))
-                    elif isinstance(row, dict):
-                        result.append(row)
-                    elif isinstance(row, tuple):
-                        result.append(dict(zip(columns, row)))
-                    else:
-                        result.append(row)
-
-            return result
+                parsedTables.move_to_end(table_name)
+
+            # access-parser returns a dict of columns: {column_name: [value for each row]}
+            columns = [sys.intern(column) for column in table.keys()]
+            # Columnar result: shorter columns (values not parsed) are padded with None, as rows are below
+            if columnar:
+                rowCount = max(map(len, table.values()), default=0)
+                data = [list(values) + [None] * (rowCount - len(values)) for values in table.values()]
+                return {"columns": columns, "data": data}
+
+            # Convert to list of dicts, pivoting columns to rows in C with zip
+            # Shorter columns (values not parsed) are padded with None, instead of truncating all rows
+            return [dict(zip(columns, row)) for row in itertools.zip_longest(*table.values())]
 
         except Exception as e:
             raise FastMCPError(f"Error querying Access 97 database: {str(e)}")
 
-    # For normal databases (SQLAlchemy)
-    # Use pandas to execute query and convert results to dict format
-    # This automatically handles proper data type conversion
-    with GetEngine(ctx, key).begin() as conn:
-        df = pd.read_sql_query(sa.text(sql), conn, params=params)
-        return df.to_dict("records")
+    return QueryAccess97
+
+
+def Query(key: str, sql: str, ctx: Context, params: dict[str, t.Any] = {},
+        columnar: bool = False) -> list[dict] | dict[str, list]:
+    """Execute a SELECT query on the database identified by key and return results as a list of records.
+    Use backticks to escape table and column names.
+    ALWAYS insert named parameters (:param_name) in the SQL query to avoid SQL injection.
+    Pass a dictionary as params to provide values for the SQL query.
+    Before executing a query, make sure to know the record count, using SELECT TOP (Access)
+    or LIMIT (SQLite) to limit the number of records returned and avoid large responses.
+    For large results, set columnar to True to get a more compact response:
+    {"columns": [column names], "data": [[values of first column], [values of second column], ...]}
+
+    IMPORTANT FOR MS ACCESS ONLY:
+    Do not use this tool to discover existing tables or query system objects or schema.
+    Instead, ask the user about existing tables, their purpose, structure and content.
+    To discover the structure of a table, use the describe tool.
+
+    NOTE: For Access 97 databases (read-only), this function supports basic SELECT queries
+    with simple WHERE conditions. Complex queries may not be fully supported.
+    """
+
+    # The query function is chosen at connection time, for the database type
+    return GetConnection(ctx, key).query_fn(sql, params, columnar)
 
 
 def Update(key: str, sql: str, ctx: Context, params: list[dict[str, t.Any]] = []) -> bool:
@@ -326,8 +742,10 @@ def Update(key: str, sql: str, ctx: Context, params: list[dict[str, t.Any]] = []
             "Only SELECT queries can be performed on Access 97 files."
         )
 
-    # Execute the update in a transaction
+    # Execute the update in a transaction, sending large parameter lists in batches
     # SQLAlchemy automatically commits if no errors occur
+    statement = _Text(sql)
     with GetEngine(ctx, key).begin() as conn:
-        conn.execute(sa.text(sql), parameters=params)
+        for start in range(0, len(params) or 1, _UPDATE_BATCH_SIZE):
+            conn.execute(statement, parameters=params[start:start + _UPDATE_BATCH_SIZE])
         return True
@@ -1,8 +1,9 @@
 """Tools for importing Excel files."""
 
-from typing import Any
-import openpyxl
-import pandas as pd
+from typing import Any, TYPE_CHECKING
+
+if TYPE_CHECKING:
+    import pandas as pd
 
 from fastmcp import Context
 from fastmcp.exceptions import FastMCPError
@@ -67,6 +68,9 @@ def ImportExcel(
     3. Use the update tool to drop unwanted columns/rows after import
     """
 
+    # pandas and openpyxl are imported when needed, to keep them out of the server startup
+    import pandas as pd
+
     # Get the engine for the database connection
     engine = GetEngine(ctx, key)
 
@@ -98,6 +102,7 @@ def ImportExcel(
 
         # Fill merged cells in Excel coordinate space
         if fillMergedCells:
+            import openpyxl
             worksheet = openpyxl.load_workbook(excelPath, data_only=True)[sheetName]
             df = FillMergedCells(worksheet, df)
             
@@ -118,10 +123,12 @@ def ImportExcel(
         raise FastMCPError(f"Error parsing Excel file: {e}")
 
 
-def FillMergedCells(worksheet, df: pd.DataFrame) -> pd.DataFrame:
+def FillMergedCells(worksheet, df: "pd.DataFrame") -> "pd.DataFrame":
     """Fill all merged cells in DataFrame with the value of the top-left cell.
     This function expects the DataFrame index and columns to match Excel row and column numbers (0-indexed).
     """
+
+    import pandas as pd
     
     # Get the merged ranges from the worksheet
     for mergedRange in worksheet.merged_cells.ranges:
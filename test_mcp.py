@@ -9,6 +9,7 @@ The following operations are performed:
 - Creates a new table
 - Adds sample data to the table
 - Prints the data in the table
+- Prints the columns of the table
 
 2. Database export:
 - Exports the data to a CSV file
@@ -32,6 +33,8 @@ The following operations are performed:
 - Reads the note from the file
 - Lists the notes found in the directory
 - Deletes the note from the file
+
+It also checks that a file with a database extension, but not a database, is rejected.
 """
 
 import asyncio
@@ -47,6 +50,8 @@ dbPathAccess  = str(Path("test.mdb").absolute())   # MS Access database
 dbPathSQLite  = str(Path("test.db").absolute())    # SQLite database
 dbPathMemory  = ""                                 # in-memory database
 
+dbPathJunk    = str(Path("junk.db").absolute())    # text file with a database extension
+
 csvPath1 = str(Path("test1.csv").absolute())
 csvPath2 = str(Path("test2.csv").absolute())
 
@@ -64,6 +69,9 @@ async def RunTests() -> None:
         await PerformTest1(mcpClient, dbPathAccess, csvPath1, "test_ACCESS")
         await PerformTest1(mcpClient, dbPathSQLite, csvPath1, "test_SQLITE")
 
+        # existing file which is not a database
+        await TestConnectUnknownHeader(mcpClient, "test_JUNK", dbPathJunk)
+
         # multiple databases, one in-memory
         await PerformTest2(mcpClient, dbPathAccess, dbPathMemory,
             csvPath1, csvPath2, key1="test_ACCESS", key2="test_MEMORY")
@@ -79,6 +87,7 @@ async def PerformTest1(mcpClient: Client, dbPath: str, csvPath: str, key: str) -
         await TestCreateTable(mcpClient, key)
         await TestInsert(mcpClient, key)
         await TestQuery(mcpClient, key)
+        await TestDescribeTable(mcpClient, key)
 
         # 2. Database export operations
         await TestExportCSV(mcpClient, key, csvPath)
@@ -1,6 +1,8 @@
 import os
+import json
 from pathlib import Path
 from fastmcp import Client
+from fastmcp.exceptions import ToolError
 from mcp.types import TextContent
 
 
@@ -32,6 +34,19 @@ async def TestConnect(mcpClient: Client, key: str, dbPath: str) -> None:
     print(f"Connected to database '{key}'")
 
 
+async def TestConnectUnknownHeader(mcpClient: Client, key: str, dbPath: str) -> None:
+    """Connect to an existing file with a database extension, but not a database: it must be rejected."""
+
+    Path(dbPath).write_text("This is not a database")
+    try:
+        await mcpClient.call_tool("connect", {"key": key, "databasePath": dbPath})
+        raise AssertionError(f"Connected to a file which is not a database: {dbPath}")
+    except ToolError as e:
+        print(f"File which is not a database rejected: {e}")
+    finally:
+        os.remove(dbPath)
+
+
 async def TestDisconnect(mcpClient: Client, key: str) -> None:
     await mcpClient.call_tool("disconnect", {"key": key})
     print("Disconnected from database.")
@@ -109,9 +124,43 @@ async def TestQueryParams(mcpClient: Client, key: str) -> None:
     print(results[0].text)
 
 
+async def TestQueryColumnar(mcpClient: Client, key: str) -> None:
+    """Check columnar results against records: same columns, one list of values per column."""
+
+    sql = "SELECT * FROM TestTable"
+    records = await mcpClient.call_tool("query", {"key": key, "sql": sql})
+    assert isinstance(records[0], TextContent)
+    records = json.loads(records[0].text)
+
+    results = await mcpClient.call_tool("query", {"key": key, "sql": sql, "columnar": True})
+    print("TestTable contents (columnar):")
+    assert isinstance(results[0], TextContent)
+    print(results[0].text)
+    columnar = json.loads(results[0].text)
+    assert columnar["columns"] == list(records[0].keys())
+    assert len(columnar["data"]) == len(columnar["columns"])
+    assert all(len(values) == len(records) for values in columnar["data"])
+
+    # no rows: columns are still listed, each with an empty list of values
+    sql = "SELECT * FROM TestTable WHERE 1=0"
+    results = await mcpClient.call_tool("query", {"key": key, "sql": sql, "columnar": True})
+    assert isinstance(results[0], TextContent)
+    empty = json.loads(results[0].text)
+    assert empty == {"columns": columnar["columns"], "data": [[] for _ in columnar["columns"]]}
+
+
 async def TestQuery(mcpClient: Client, key: str) -> None:
     await TestQueryDirect(mcpClient, key)
     await TestQueryParams(mcpClient, key)
+    await TestQueryColumnar(mcpClient, key)
+
+
+async def TestDescribeTable(mcpClient: Client, key: str) -> None:
+    results = await mcpClient.call_tool("describe", {"key": key, "table": "TestTable"})
+    print("TestTable columns:")
+    assert isinstance(results[0], TextContent)
+    assert "Emoji" in results[0].text
+    print(results[0].text)
 
 
 async def TestDropTable(mcpClient: Client, key: str) -> None: